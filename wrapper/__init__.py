@@ -1,4 +1,4 @@
 from . import statement
-from .sqlite import From, Handler, Order, Pair, Query, Select, Where
+from .sqlite import From, Handler, Order, Pair, Query, QueryIter, Select, Where
 
-__all__: list[str] = ["statement", "From", "Handler", "Order", "Pair", "Query", "Select", "Where"]
+__all__: list[str] = ["statement", "From", "Handler", "Order", "Pair", "Query", "QueryIter", "Select", "Where"]
@@ -1,25 +1,142 @@
 import csv
+import os
+import shutil
 import sqlite3
+import subprocess
+import time
+import weakref
 from collections.abc import Iterable, Iterator, Mapping, Sequence
-from contextlib import closing
-from dataclasses import dataclass
-from datetime import datetime
-from functools import cached_property
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from itertools import groupby
 from operator import itemgetter
 from pathlib import Path
-from sqlite3 import Connection, Row
+from queue import Empty, Full, Queue
+from sqlite3 import Connection, Cursor, Row
+from stat import S_ISREG
+from threading import Lock, RLock
 from typing import Any, Literal, Self, TypeAlias
 
+from .statement import Expr
+
 From: TypeAlias = str | list[str]
 Select: TypeAlias = list[str] | None
-Where: TypeAlias = dict[str, str] | None
+Where: TypeAlias = dict[str, str | Expr] | None
 Pair: TypeAlias = Mapping[str, Any]
 Query: TypeAlias = list[Row]
+QueryIter: TypeAlias = Iterator[Row]
+
+Params: TypeAlias = Sequence[Any]
+Clause: TypeAlias = tuple[str, Params]
+Statement: TypeAlias = tuple[str, Iterable[Params]]
 
 OrderVal: TypeAlias = Literal["ASC", "DESC", "ASC NULLS LAST", "DESC NULLS FIRST"]
 Order: TypeAlias = dict[str, OrderVal] | None
 
+# Hashable forms of the statement arguments, used as cache keys
+FromKey: TypeAlias = str | tuple[str, ...]
+SelectKey: TypeAlias = tuple[str, ...]
+WhereKey: TypeAlias = tuple[tuple[str, str], ...]
+OrderKey: TypeAlias = tuple[tuple[str, OrderVal], ...]
+
+# Seconds between planner statistics refreshes on each connection
+_OPTIMIZE_INTERVAL = 900
+
+# Column layout of PRAGMA table_xinfo rows
+_XINFO_COLS = ("cid", "name", "type", "notnull", "dflt_value", "pk", "hidden")
+
+
+# SQL identifier quoting, so column names render the same in every statement
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=512)
+# SQL statements generator for select columns
+def _sql_select(select: SelectKey) -> str:
+    return ", ".join(select) if select else "*"
+
+
+@lru_cache(maxsize=512)
+# SQL statements generator for joined tables
+def _sql_join(tables: FromKey) -> str:
+    return " NATURAL JOIN ".join(tables) if isinstance(tables, tuple) else tables
+
+
+@lru_cache(maxsize=512)
+# SQL statements generator for where conditions
+def _sql_where(where: WhereKey) -> str:
+    return f"WHERE {' AND '.join([f'{key} {expr}' for key, expr in where])}" if where else ""
+
+
+@lru_cache(maxsize=512)
+# SQL statements generator for order conditions
+def _sql_order(order: OrderKey) -> str:
+    return f"ORDER BY {','.join([f'{key} {val}' for key, val in order])}" if order else ""
+
+
+@lru_cache(maxsize=512)
+# SQL statements generator for select queries
+def _sql_select_cached(tables: FromKey, select: SelectKey, where: WhereKey, order: OrderKey, limit: bool) -> str:
+    lim = "LIMIT ?" if limit else ""
+    return f"SELECT {_sql_select(select)} FROM {_sql_join(tables)} {_sql_where(where)} {_sql_order(order)} {lim};"
+
+
+@dataclass
+# Mutable connection state of a Handler, kept apart so the Handler itself stays frozen
+class _Pool:
+    # Single writer connection and its guard
+    lock: RLock = field(default_factory=RLock)
+    writer: Connection | None = None
+
+    # Idle reader connections, readers from an older generation are closed instead of pooled
+    readers: Queue[Connection] = field(default_factory=lambda: Queue(os.cpu_count() or 1))
+    readers_lock: Lock = field(default_factory=Lock)
+    active: int = 0
+    generation: int = 0
+
+    # Last planner statistics refresh of each open connection, and in-memory writes since the last flush
+    optimized: dict[Connection, float] = field(default_factory=dict)
+    pending: int = 0
+
+    # Database file an in-memory writer is flushed to, None for an on-disk writer
+    flush_to: Path | None = None
+
+    # In-memory database writer to the database file
+    def flush(self: Self, conn: Connection) -> None:
+        if self.flush_to:
+            with closing(sqlite3.connect(self.flush_to)) as disk:
+                conn.backup(disk, pages=1000)
+            self.pending = 0
+
+    # Connection closer, refreshing planner statistics first
+    def close_conn(self: Self, conn: Connection) -> None:
+        self.optimized.pop(conn, None)
+        conn.execute("PRAGMA optimize;")
+        conn.close()
+
+    # Pooled connections closer, flushing an in-memory writer first
+    def close(self: Self) -> None:
+        with self.lock:
+            with self.readers_lock:
+                self.close_locked()
+
+    # Pooled connections closer, with both locks held
+    def close_locked(self: Self) -> None:
+        if writer := self.writer:
+            self.writer = None
+            self.flush(writer)
+            self.close_conn(writer)
+
+        # Readers checked out now are closed when returned
+        self.generation += 1
+        while True:
+            try:
+                self.close_conn(self.readers.get_nowait())
+            except Empty:
+                break
+
 
 @dataclass(frozen=True)
 # Wrapper class for sqlite3.Connection
@@ -28,13 +145,22 @@ class Handler:
     schema: str | Path
     backups: int = 3
     threshold: int = 10
+    cached_statements: int = 512
+    mmap_size: int = 1 << 30  # bytes
+    cache_size: int = -65536  # pages if positive, KiB if negative
+    in_memory: bool = False  # work on an in-memory copy, flushed every threshold writes, on close and at exit
+
+    _pool: _Pool = field(default_factory=_Pool, init=False, repr=False, compare=False)
 
     # SQLite Database schema runner
     def __post_init__(self: Self) -> None:
-        with closing(sqlite3.connect(self.__database)) as conn:
-            with Path(self.__schema).open() as schema:
-                with conn:
-                    conn.executescript(schema.read())
+        # The finalizer holds only the pool, so unclosed handlers still flush and close when collected or at exit
+        self._pool.flush_to = self.__database if self.in_memory else None
+        weakref.finalize(self, self._pool.close)
+
+        with self._writer() as conn:
+            with self.__schema.open() as schema:
+                conn.executescript(schema.read())
 
     @cached_property
     def __database(self: Self) -> Path:
@@ -48,106 +174,313 @@ class Handler:
     def __backups(self: Self) -> int:
         return abs(self.backups)
 
+    @cached_property
+    def __db_mode(self: Self) -> int:
+        return self.__database.stat().st_mode
+
+    # SQLite writer connection opener
+    def _connect_writer(self: Self) -> Connection:
+        conn = self._connect(isolation_level=None, memory=self.in_memory)
+        if self.in_memory:
+            with closing(sqlite3.connect(self.__database)) as disk:
+                disk.backup(conn, pages=1000)
+        return conn
+
+    # SQLite Connection opener
+    def _connect(self: Self, isolation_level: str | None = "DEFERRED", memory: bool = False) -> Connection:
+        conn = sqlite3.connect(
+            ":memory:" if memory else self.__database,
+            isolation_level=isolation_level,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.row_factory = Row
+        self._conn_run(conn)
+        return conn
+
     # SQLite Connection common pragma
     def _conn_run(self: Self, conn: Connection) -> None:
-        conn.execute("PRAGMA foreign_keys = ON;")
-        conn.execute("PRAGMA journal_mode = WAL;")
-        conn.execute("PRAGMA synchronous = NORMAL;")
+        # Nothing to recover an in-memory database from, so it skips journal syncs altogether
+        journal, sync = ("MEMORY", "OFF") if self.in_memory else ("WAL", "NORMAL")
+        conn.executescript(
+            f"""
+            PRAGMA busy_timeout = 5000;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA mmap_size = {int(self.mmap_size)};
+            PRAGMA cache_size = {int(self.cache_size)};
+            PRAGMA foreign_keys = ON;
+            PRAGMA journal_mode = {journal};
+            PRAGMA synchronous = {sync};
+            """
+        )
+
+    # SQLite Connection planner statistics refresher, at most once per interval
+    # Before SQLite 3.46 optimize only looks at tables queried on the same connection, so every connection runs it
+    def _conn_optimize(self: Self, conn: Connection) -> None:
+        now = time.monotonic()
+        if now - self._pool.optimized.setdefault(conn, now) > _OPTIMIZE_INTERVAL:
+            conn.execute("PRAGMA optimize;")
+            self._pool.optimized[conn] = now
+
+    # SQLite Handler writer connection getter
+    @contextmanager
+    def _writer(self: Self) -> Iterator[Connection]:
+        pool = self._pool
+        with pool.lock:
+            if pool.writer is None:
+                pool.writer = self._connect_writer()
+            self._conn_optimize(pool.writer)
+            yield pool.writer
+
+    # SQLite Handler reader connection getter, returned to the pool after use
+    @contextmanager
+    def _reader(self: Self) -> Iterator[Connection]:
+        # An in-memory database only exists on the writer connection
+        if self.in_memory:
+            with self._writer() as conn:
+                yield conn
+            return
+
+        pool = self._pool
+        with pool.readers_lock:
+            pool.active += 1
+            generation = pool.generation
+            try:
+                conn = pool.readers.get_nowait()
+            except Empty:
+                conn = None
+
+        try:
+            if conn is None:
+                conn = self._connect()
+            yield conn
+        finally:
+            if conn is not None:
+                self._conn_optimize(conn)
+            with pool.readers_lock:
+                pool.active -= 1
+                if conn is not None and generation == pool.generation:
+                    try:
+                        pool.readers.put_nowait(conn)
+                        conn = None
+                    except Full:
+                        pass
+                if conn is not None:
+                    pool.close_conn(conn)
+
+    # SQLite Handler pooled connections closer
+    def close(self: Self) -> None:
+        self._pool.close()
+
+    # SQLite Handler written batches counter, flushing in-memory database past threshold
+    def _written(self: Self, conn: Connection) -> None:
+        if not self.in_memory:
+            return
+
+        self._pool.pending += 1
+        if self._pool.pending >= self.threshold:
+            self._pool.flush(conn)
+
+    # SQLite Handler in-memory database flusher
+    def flush_to_disk(self: Self) -> None:
+        with self._writer() as conn:
+            self._pool.flush(conn)
+
+    # SQLite Handler write transaction, taking the write lock up front
+    @contextmanager
+    def _transaction(self: Self) -> Iterator[Connection]:
+        with self._writer() as conn:
+            conn.execute("BEGIN IMMEDIATE;")
+            try:
+                yield conn
+                conn.execute("COMMIT;")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK;")
+                raise
+            self._written(conn)
 
     # SQLite Handler SQL statements executer
-    def _execute(self: Self, sqls: str | list[str]) -> None:
+    def _execute(self: Self, stmts: Statement | list[Statement]) -> None:
+        if not isinstance(stmts, list):
+            stmts = [stmts]
+
+        with self._transaction() as conn:
+            with closing(conn.cursor()) as cur:
+                for sql, params in stmts:
+                    cur.executemany(sql, params)
+
+    # SQLite Handler SQL script executer, for batches of unparameterized statements
+    def _execute_script(self: Self, sqls: str | list[str]) -> None:
         if not isinstance(sqls, list):
             sqls = [sqls]
 
-        with closing(sqlite3.connect(self.__database)) as conn:
-            with conn:
-                self._conn_run(conn)
-                with closing(conn.cursor()) as cur:
-                    for sql in sqls:
-                        cur.execute(sql)
+        # executescript commits any pending transaction first, so the script carries its own
+        with self._writer() as conn:
+            try:
+                conn.executescript("\n".join(["BEGIN IMMEDIATE;", *sqls, "COMMIT;"]))
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK;")
+                raise
+            self._written(conn)
 
     # SQLite Handler SQL data fetcher
-    def _fetch(self: Self, sql: str, fetch: int) -> Query:
-        with closing(sqlite3.connect(self.__database)) as conn:
-            conn.row_factory = Row
-            with conn:
-                self._conn_run(conn)
+    def _fetch(self: Self, sql: str, params: Params) -> Query:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cur:
-                cur.execute(sql)
-                return cur.fetchmany(fetch or -1)
+                cur.execute(sql, params)
+                return cur.fetchall()
 
-    # SQLite Handler SQL data exporter
-    def _export(self: Self, sql: str, path: Path) -> None:
-        with closing(sqlite3.connect(self.__database)) as conn:
-            conn.row_factory = Row
-            with conn:
-                self._conn_run(conn)
+    # SQLite Handler SQL single value fetcher
+    def _fetch_value(self: Self, sql: str, params: Params) -> int | float | str | bytes | None:
+        with self._reader() as conn:
+            with closing(conn.cursor()) as cur:
+                cur.row_factory = None
+                row = cur.execute(sql, params).fetchone()
+                return row[0] if row else None
+
+    # SQLite Handler PRAGMA rows fetcher, as plain tuples
+    def _pragma_rows(self: Self, pragma: str) -> list[tuple[Any, ...]]:
+        with self._reader() as conn:
+            with closing(conn.cursor()) as cur:
+                cur.row_factory = None
+                return cur.execute(pragma).fetchall()
+
+    # SQLite Handler SQL query cursor on a pooled reader connection
+    @contextmanager
+    def _query(
+        self: Self, sql: str, params: Params, factory: type[Row] | None = Row, arraysize: int = 1000
+    ) -> Iterator[Cursor]:
+        with self._reader() as conn:
             with closing(conn.cursor()) as cur:
-                cur.execute(sql)
-                cols = (col[0] for col in cur.description)
-                with path.open("w", newline="") as file:
-                    writer = csv.writer(file)
-                    writer.writerow(cols)
-                    writer.writerows(cur)
+                cur.row_factory = factory
+                cur.arraysize = arraysize
+                cur.execute(sql, params)
+                yield cur
+
+    # SQLite Handler SQL data streamer, holding arraysize rows in memory at a time
+    def _iter_fetch(self: Self, cur: Cursor) -> Iterator[Any]:
+        while batch := cur.fetchmany():
+            yield from batch
+
+    # SQLite Handler SQL data exporter
+    def _export(self: Self, sql: str, params: Params, path: Path) -> None:
+        # csv only needs plain tuples
+        with self._query(sql, params, None) as cur:
+            cols = (col[0] for col in cur.description)
+            with path.open("w", newline="", buffering=1 << 20) as file:
+                writer = csv.writer(file)
+                writer.writerow(cols)
+                writer.writerows(self._iter_fetch(cur))
+
+    # SQLite CLI data exporter, writes csv without building Python rows
+    # Not a drop-in for _export: the CLI prints REAL values with 15 significant digits,
+    # writes BLOB values as empty fields and also quotes text with leading or trailing spaces
+    def _export_cli(self: Self, sql: str, params: Params, path: Path) -> bool:
+        # The CLI cannot bind parameters, so only plain queries take this path
+        if params or not (cli := shutil.which("sqlite3")):
+            return False
+
+        self.flush_to_disk()
+        with path.open("wb") as file:
+            cmd = [cli, "-csv", "-header", "-newline", "\r\n", str(self.__database), sql]
+            subprocess.run(cmd, stdout=file, check=True)  # noqa: S603
+
+        # The CLI writes no header for an empty result, the Python exporter writes just the header then
+        if not path.stat().st_size:
+            self._export(sql, params, path)
+        return True
 
     # SQLite Database backup creator
     def backup_create(self: Self) -> None:
-        bck_time = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        bck_time = f"{time.time_ns():020d}"
         bck_path = self.__database.parent / f"{self.__database.stem}_{bck_time}{self.__database.suffix}.bak"
 
-        backups = sorted(self.backup_list())
+        backups = self.backup_list()
         if len(backups) >= self.__backups:
-            backups[0].unlink()
+            min(backups, key=itemgetter(0))[1].unlink()
 
-        with closing(sqlite3.connect(self.__database)) as cur:
+        with self._writer() as src:
             with closing(sqlite3.connect(bck_path)) as bck:
-                with cur, bck:
-                    cur.backup(bck)
+                src.backup(bck, pages=1000)
 
     # SQLite Database backup file checker
     def backup_check(self: Self, backup: Path) -> Path:
-        if not backup.is_file():
+        mode = backup.stat().st_mode  # raises FileNotFoundError if missing
+        if not S_ISREG(mode):
             raise FileNotFoundError
-        if backup.stat().st_mode != self.__database.stat().st_mode:
+        if mode != self.__db_mode:
             raise PermissionError
         return backup
 
-    # SQLite Database backup file list getter
-    def backup_list(self: Self) -> Iterator[Path]:
-        return self.__database.parent.glob(f"{self.__database.stem}_*{self.__database.suffix}.bak")
+    # SQLite Database backup file list getter, as (modified time, path) pairs
+    def backup_list(self: Self) -> list[tuple[float, Path]]:
+        prefix = f"{self.__database.stem}_"
+        suffix = f"{self.__database.suffix}.bak"
+        with os.scandir(self.__database.parent) as entries:
+            return [
+                (entry.stat().st_mtime, Path(entry.path))
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+            ]
 
     # SQLite Database backup file setter
     def backup_set(self: Self, backup: Path) -> None:
         path = self.backup_check(backup)
-        path.replace(self.__database)
+        with self._pool.lock:
+            with self._pool.readers_lock:
+                # A reader still attached to the old file would keep its WAL alive over the restored one
+                if self._pool.active:
+                    raise BlockingIOError
+                self._pool.close_locked()
+                path.replace(self.__database)
 
     # SQLite Database backup file deleter
     def backup_pop(self: Self, backup: Path) -> None:
         path = self.backup_check(backup)
         path.unlink()
 
-    # SQLite Handler internal select statements generator
-    def _sql_select(self: Self, select: Select) -> str:
-        return ", ".join(select) if select else "*"
+    # SQLite Handler internal select columns key generator
+    def _key_select(self: Self, select: Select) -> SelectKey:
+        return tuple(select) if select else ()
+
+    # SQLite Handler internal join tables key generator
+    def _key_join(self: Self, tables: From) -> FromKey:
+        return tuple(tables) if isinstance(tables, list) else tables
 
-    # SQLite Handler internal join statements generator
-    def _sql_join(self: Self, tables: From) -> str:
-        return " NATURAL JOIN ".join(tables) if isinstance(tables, list) else tables
+    # SQLite Handler internal where conditions key generator, split from their bound values
+    def _key_where(self: Self, where: Where) -> tuple[WhereKey, Params]:
+        if not where:
+            return (), ()
 
-    # SQLite Handler internal where statements generator
-    def _sql_where(self: Self, where: Where) -> str:
-        return f"WHERE {' AND '.join([f'{key} {where[key]}' for key in where])}" if where else ""
+        exprs: list[tuple[str, str]] = []
+        params: list[Any] = []
+        for key, val in where.items():
+            expr, args = (val, ()) if isinstance(val, str) else val
+            exprs.append((key, expr))
+            params.extend(args)
+        return tuple(exprs), params
 
-    # SQLite Handler internal order statements generator
-    def _sql_order(self: Self, order: Order) -> str:
-        return f"ORDER BY {','.join([f'{key} {order[key]}' for key in order])}" if order else ""
+    # SQLite Handler internal order conditions key generator
+    def _key_order(self: Self, order: Order) -> OrderKey:
+        return tuple(order.items()) if order else ()
+
+    # SQLite Handler internal limit statements generator
+    def _sql_limit(self: Self, limit: int) -> Clause:
+        return ("LIMIT ?", (limit,)) if limit > 0 else ("", ())
 
     # SQLite Handler internal ignore statements generator
     def _sql_ignore(self: Self, ignore: bool) -> str:
         return "OR IGNORE " if ignore else ""
 
-    def _row_insert(self: Self, data: Pair, ignore: bool, table: str) -> str:
-        return f"INSERT {self._sql_ignore(ignore)}INTO {table} {tuple(data.keys())} VALUES {tuple(data.values())};"
+    # SQLite Handler internal values placeholders generator
+    def _sql_values(self: Self, size: int) -> str:
+        return f"({', '.join(['?'] * size)})"
+
+    def _row_insert(self: Self, keys: tuple[str, ...], rows: Iterable[Pair], ignore: bool, table: str) -> Statement:
+        sql = f"INSERT {self._sql_ignore(ignore)}INTO {table} ({', '.join(map(_quote_ident, keys))}) VALUES {self._sql_values(len(keys))};"
+        return sql, [tuple(pair[key] for key in keys) for pair in rows]
 
     # SQLite Handler insert rows
     def row_insert(self: Self, table: str, data: Pair | Sequence[Pair], ignore: bool = False) -> None:
@@ -158,24 +491,29 @@ class Handler:
         if len(data) > self.threshold:
             self.backup_create()
 
-        sqls = [self._row_insert(pair, ignore, table) for pair in data if pair]
-        self._execute(sqls)
+        # Consecutive rows sharing the same columns are bound to a single statement, keeping input order
+        rows = [pair for pair in data if pair]
+        groups = groupby(rows, lambda pair: tuple(sorted(pair.keys())))
+        stmts = [self._row_insert(keys, group, ignore, table) for keys, group in groups]
+        self._execute(stmts)
 
     # SQLite Handler update rows by conditions
     def row_update(self: Self, table: str, data: Pair, where: Where) -> None:
         if not (table and data):
             return
 
-        sql = f"UPDATE {table} SET {tuple(data.keys())} = {tuple(data.values())} {self._sql_where(where)};"
-        self._execute(sql)
+        cond, params = self._key_where(where)
+        sql = f"UPDATE {table} SET {', '.join([f'{_quote_ident(key)} = ?' for key in data])} {_sql_where(cond)};"
+        self._execute((sql, [(*data.values(), *params)]))
 
     # SQLite Handler delete rows by conditions
     def row_delete(self: Self, table: str, where: Where) -> None:
         if not (table):
             return
 
-        sql = f"DELETE FROM {table} {self._sql_where(where)};"
-        self._execute(sql)
+        cond, params = self._key_where(where)
+        sql = f"DELETE FROM {table} {_sql_where(cond)};"
+        self._execute((sql, [params]))
 
     def _table_drop(self: Self, table: str) -> str:
         return f"DROP TABLE IF EXISTS {table};"
@@ -186,7 +524,7 @@ class Handler:
             tables = [tables]
 
         sqls = [self._table_drop(table) for table in tables if table]
-        self._execute(sqls)
+        self._execute_script(sqls)
 
     def _col_default(self: Self, default: object | None) -> str:
         return f"DEFAULT {default}" if default else ""
@@ -196,14 +534,13 @@ class Handler:
             return
 
         sql = f"ALTER TABLE {table} ADD COLUMN {col} {sql_type.upper()} {self._col_default(default)};"
-        self._execute(sql)
+        self._execute_script(sql)
 
-    def _col_name(self: Self, rows: Iterable[Row]) -> list[str]:
-        return [row["name"] for row in rows]
+    def _col_name(self: Self, rows: Iterable[tuple[Any, ...]]) -> list[str]:
+        return [row[1] for row in rows]
 
-    def _col_info(self: Self, table: str) -> Query:
-        sql = f"PRAGMA table_info({table});"
-        return self._fetch(sql, 0)
+    def _col_info(self: Self, table: str) -> list[tuple[Any, ...]]:
+        return self._pragma_rows(f"PRAGMA table_xinfo({table});")
 
     def col_name(self: Self, table: str) -> list[str] | None:
         if query := self._col_info(table):
@@ -211,33 +548,66 @@ class Handler:
 
     def col_name_group(self: Self, table: str, mask: str) -> dict[Any, list[str]] | None:
         if query := self._col_info(table):
-            return {idx: self._col_name(group) for idx, group in groupby(query, itemgetter(mask))}  # type: ignore
+            idx = _XINFO_COLS.index(mask)
+            groups: dict[Any, list[str]] = {}
+            for row in query:
+                groups.setdefault(row[idx], []).append(row[1])
+            return groups
 
     # SQLite Handler internal select statements generator
-    def sql_select(self: Self, tables: From, select: Select = None, where: Where = None, order: Order = None) -> str:
-        return f"SELECT {self._sql_select(select)} FROM {self._sql_join(tables)} {self._sql_where(where)} {self._sql_order(order)};"
+    def sql_select(
+        self: Self, tables: From, select: Select = None, where: Where = None, order: Order = None, limit: int = 0
+    ) -> Clause:
+        cond, params = self._key_where(where)
+        lim, lim_params = self._sql_limit(limit)
+        sql = _sql_select_cached(
+            self._key_join(tables), self._key_select(select), cond, self._key_order(order), bool(lim)
+        )
+        return sql, (*params, *lim_params)
 
     # SQLite Handler all data
     def fetch_all(self: Self, table: str, fetch: int = 0) -> Query:
-        sql = f"SELECT * FROM {table};"
-        return self._fetch(sql, fetch)
+        lim, params = self._sql_limit(fetch)
+        sql = f"SELECT * FROM {table} {lim};"
+        return self._fetch(sql, params)
 
     # SQLite Handler fetch data by conditions
     def fetch(
         self: Self, tables: From, select: Select = None, where: Where = None, order: Order = None, fetch: int = 0
     ) -> Query:
-        sql = self.sql_select(tables, select, where, order)
-        return self._fetch(sql, fetch)
+        sql, params = self.sql_select(tables, select, where, order, fetch)
+        return self._fetch(sql, params)
+
+    # SQLite Handler stream data by conditions, the reader is held until the iterator is exhausted or closed
+    def fetch_iter(
+        self: Self, tables: From, select: Select = None, where: Where = None, order: Order = None, fetch: int = 0
+    ) -> QueryIter:
+        sql, params = self.sql_select(tables, select, where, order, fetch)
+        # The in-memory reader is the locked writer, so rows are loaded up front instead of holding it across yields
+        if self.in_memory:
+            yield from self._fetch(sql, params)
+            return
+
+        with self._query(sql, params) as cur:
+            yield from self._iter_fetch(cur)
 
     # SQLite Handler export data by conditions as csv file
+    # cli uses the sqlite3 shell when available, trading REAL precision and BLOB values for speed
     def export(
-        self: Self, path: Path, tables: From, select: Select = None, where: Where = None, order: Order = None
+        self: Self,
+        path: Path,
+        tables: From,
+        select: Select = None,
+        where: Where = None,
+        order: Order = None,
+        cli: bool = False,
     ) -> None:
-        sql = self.sql_select(tables, select, where, order)
-        return self._export(sql, path)
+        sql, params = self.sql_select(tables, select, where, order)
+        if not (cli and self._export_cli(sql, params, path)):
+            self._export(sql, params, path)
 
     # SQLite Handler get number of rows by conditions
     def count(self: Self, tables: From, where: Where = None) -> int:
-        sql = f"SELECT COUNT(*) FROM {self._sql_join(tables)} {self._sql_where(where)};"
-        query = self._fetch(sql, 0)
-        return int(query[0][0]) if query else 0
+        cond, params = self._key_where(where)
+        sql = f"SELECT COUNT(*) FROM {_sql_join(self._key_join(tables))} {_sql_where(cond)};"
+        return int(self._fetch_value(sql, params) or 0)
@@ -1,71 +1,69 @@
 from functools import cache
+from typing import Any, TypeAlias
+
+# SQL expression with its "?" placeholders and the values bound to them
+Expr: TypeAlias = tuple[str, tuple[Any, ...]]
+
+# Operator prefix of negatable expressions, indexed by negate
+_NEGATE = ("", "NOT ")
 
 
-@cache
 # SQL statements generator for equal expressions
-def val_eq(val: str | bool | float) -> str:
+def val_eq(val: str | bool | float) -> Expr:
     """expression == val"""
-    return f"== '{val}'"
+    return "== ?", (val,)
 
 
-@cache
 # SQL statements generator for not equal expressions
-def val_neq(val: str | bool | float) -> str:
+def val_neq(val: str | bool | float) -> Expr:
     """expression != val"""
-    return f"!= '{val}'"
+    return "!= ?", (val,)
 
 
-@cache
 # SQL statements generator for less than expressions
-def val_lt(val: float) -> str:
+def val_lt(val: float) -> Expr:
     """expression < val"""
-    return f"< '{val}'"
+    return "< ?", (val,)
 
 
-@cache
 # SQL statements generator for greater than expressions
-def val_gt(val: float) -> str:
+def val_gt(val: float) -> Expr:
     """expression > val"""
-    return f"> '{val}'"
+    return "> ?", (val,)
 
 
-@cache
 # SQL statements generator for less than or equal expressions
-def val_lte(val: float) -> str:
+def val_lte(val: float) -> Expr:
     """expression <= val"""
-    return f"<= '{val}'"
+    return "<= ?", (val,)
 
 
-@cache
 # SQL statements generator for greater than or equal expressions
-def val_gte(val: float) -> str:
+def val_gte(val: float) -> Expr:
     """expression >= val"""
-    return f">= '{val}'"
+    return ">= ?", (val,)
 
 
-@cache
 # SQL statements generator for (not) in expressions
-def val_in(*args: str | float, negate: bool = False) -> str:
+def val_in(*args: str | float, negate: bool = False) -> Expr:
     """expression IN (value1, value2, .... value_n), where n > 1"""
-    return f"{'NOT ' if negate else ''}IN {args}"
+    return f"{_NEGATE[negate]}IN ({', '.join(['?'] * len(args))})", args
 
 
-@cache
 # SQL statements generator for value (not) between expressions
-def val_btw(lower: str | float, upper: str | float, negate: bool = False) -> str:
+def val_btw(lower: str | float, upper: str | float, negate: bool = False) -> Expr:
     """expression BETWEEN lower AND upper"""
-    return f"{'NOT ' if negate else ''}BETWEEN '{lower}' AND '{upper}'"
+    return f"{_NEGATE[negate]}BETWEEN ? AND ?", (lower, upper)
 
 
-@cache
 # SQL statements generator for (not) like expressions
-def val_like(pattern: str, negate: bool = False) -> str:
+def val_like(pattern: str, negate: bool = False) -> Expr:
     """expression LIKE pattern"""
-    return f"{'NOT ' if negate else ''}LIKE '{pattern}'"
+    return f"{_NEGATE[negate]}LIKE ?", (pattern,)
 
 
 @cache
 # SQL statements generator for is (not) null expressions
-def val_null(negate: bool = False) -> str:
+def val_null(negate: bool = False) -> Expr:
     """expression IS NULL"""
-    return f"IS {'NOT ' if negate else ''}NULL"
+    return f"IS {_NEGATE[negate]}NULL", ()